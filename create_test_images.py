@@ -4,6 +4,7 @@ Example script to test the image converter with a generated test image
 """
 
 from PIL import Image, ImageDraw
+import numpy as np
 import os
 from pathlib import Path
 
@@ -32,23 +33,19 @@ def create_test_images():
     img.save(base_dir / "logos" / "company_logo.png")
     print("Created: example/logos/company_logo.png")
     
-    # Create a gradient background
-    img = Image.new('RGB', (128, 64), color='black')
-    draw = ImageDraw.Draw(img)
-    for i in range(128):
-        color = int(255 * i / 128)
-        draw.line([(i, 0), (i, 64)], fill=(color, color // 2, 255 - color))
-    img.save(base_dir / "backgrounds" / "gradient.png")
+    # Create a gradient background, built as one row and broadcast down
+    x = np.arange(128, dtype=np.uint16)
+    r = (255 * x // 128).astype(np.uint8)
+    row = np.stack([r, r // 2, 255 - r], axis=-1)
+    arr = np.broadcast_to(row[None, :, :], (64, 128, 3)).copy()
+    Image.fromarray(arr).save(base_dir / "backgrounds" / "gradient.png")
     print("Created: example/backgrounds/gradient.png")
     
-    # Create a simple pattern
-    img = Image.new('RGB', (16, 16), color='white')
-    draw = ImageDraw.Draw(img)
-    for x in range(0, 16, 2):
-        for y in range(0, 16, 2):
-            if (x + y) % 4 == 0:
-                draw.rectangle([x, y, x+1, y+1], fill='black')
-    img.save(base_dir / "pattern.png")
+    # Create a simple pattern: black 2x2 blocks on a diagonal checkerboard
+    y, x = np.indices((16, 16)) // 2
+    black = (x + y) % 2 == 0
+    arr = np.where(black[..., None], 0, 255).astype(np.uint8).repeat(3, axis=-1)
+    Image.fromarray(arr).save(base_dir / "pattern.png")
     print("Created: example/pattern.png")
     
     print("\nTest images created! Now run:")
@@ -11,21 +11,185 @@ Output format: C header files with RGB565 format arrays
 """
 
 import os
+import re
 import sys
 import argparse
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from PIL import Image
 import numpy as np
 
 
+# C header templates, filled in with str.format_map. Pixel rows are streamed
+# between a *_HEADER and its matching *_FOOTER template.
+_PREAMBLE_TMPL = """\
+/*
+ * Generated from: {fname}
+ * Image size: {w}x{h} pixels
+ * Format: {fmt}
+ * Generator version: {version}
+ */
+
+#pragma once
+#include <stdint.h>
+
+#define {U}_WIDTH  {w}
+#define {U}_HEIGHT {h}
+
+"""
+
+_STRUCT_TMPL = """\
+typedef struct {{
+    const uint16_t* data;
+    uint16_t width;
+    uint16_t height;
+}} {v}_t;
+
+const {v}_t {v} = {{
+    .data = {v}_data,
+    .width = {U}_WIDTH,
+    .height = {U}_HEIGHT
+}};"""
+
+_HEADER_TMPL = _PREAMBLE_TMPL + """\
+const uint16_t {v}_data[{n}] = {{
+"""
+
+_FOOTER_TMPL = """\
+}};
+
+""" + _STRUCT_TMPL
+
+_BINARY_TMPL = _PREAMBLE_TMPL + """\
+/* Embed with: target_add_binary_data(${{COMPONENT_TARGET}} "{bin_name}" BINARY) */
+extern const uint16_t {v}_data[] asm("_binary_{bin_symbol}_start");
+
+""" + _STRUCT_TMPL
+
+_PALETTE_HEADER_TMPL = _PREAMBLE_TMPL + """\
+#define {U}_PALETTE_SIZE {palette_size}
+
+const uint16_t {v}_palette[{palette_size}] = {{
+{palette}
+}};
+
+const uint8_t {v}_indices[{n}] = {{
+"""
+
+_PALETTE_FOOTER_TMPL = """\
+}};
+
+typedef struct {{
+    const uint16_t* palette;
+    const uint8_t* indices;
+    uint16_t palette_size;
+    uint16_t width;
+    uint16_t height;
+}} {v}_t;
+
+const {v}_t {v} = {{
+    .palette = {v}_palette,
+    .indices = {v}_indices,
+    .palette_size = {U}_PALETTE_SIZE,
+    .width = {U}_WIDTH,
+    .height = {U}_HEIGHT
+}};"""
+
+_BUNDLE_HEADER_TMPL = """\
+/*
+ * Generated from: images in {source}
+ * Format: RGB565
+ */
+
+#pragma once
+#include <stdint.h>
+
+typedef struct {{
+    const uint16_t* data;
+    uint16_t width;
+    uint16_t height;
+    const char* name;
+}} image_t;
+
+"""
+
+_BUNDLE_ENTRY_HEADER_TMPL = """\
+/* Generated from: {fname} ({w}x{h} pixels) */
+#define {U}_WIDTH  {w}
+#define {U}_HEIGHT {h}
+
+static const uint16_t {v}_data[{n}] = {{
+"""
+
+_BUNDLE_ENTRY_FOOTER_TMPL = """\
+}};
+
+static const image_t {v} = {{
+    .data = {v}_data,
+    .width = {U}_WIDTH,
+    .height = {U}_HEIGHT,
+    .name = "{v}"
+}};
+
+"""
+
+_BUNDLE_REGISTRY_TMPL = """\
+/* {count} images bundled from {source} */
+#define ALL_IMAGES_COUNT {count}
+
+static const image_t* const all_images[ALL_IMAGES_COUNT] = {{
+{entries}
+}};"""
+
+
 class ImageConverter:
     """Converts images to C array format for ESP32"""
     
     SUPPORTED_FORMATS = {'.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tiff'}
     
-    def __init__(self, source_dir, output_dir):
+    # ASCII codes of the hex digits, indexed by nibble value
+    _HEX_DIGITS = np.frombuffer(b"0123456789ABCDEF", dtype=np.uint8)
+    
+    # Number of pixel rows encoded and written per chunk
+    ROWS_PER_WRITE = 64
+    
+    # 4x4 ordered-dither thresholds (0-15) used by --dither
+    _BAYER_4X4 = np.array([[0, 8, 2, 10],
+                           [12, 4, 14, 6],
+                           [3, 11, 1, 9],
+                           [15, 7, 13, 5]], dtype=np.int16)
+    
+    # Identifiers declared by the bundle header itself
+    BUNDLE_RESERVED_NAMES = {'image_t', 'all_images', 'ALL_IMAGES_COUNT'}
+    
+    # Per-image outcomes reported by convert_image_file
+    CONVERTED = 'converted'
+    SKIPPED = 'skipped'
+    FAILED = 'failed'
+    
+    # Bump whenever the generated output changes for the same options, so
+    # headers from older versions are regenerated instead of skipped
+    GENERATOR_VERSION = 2
+    
+    # Modes whose pixels are read directly instead of converting to RGB
+    DIRECT_MODES = {'RGB', 'RGBA', 'L'}
+    
+    # Below this many images a worker pool costs more than it saves
+    MIN_PARALLEL_TASKS = 4
+    
+    def __init__(self, source_dir, output_dir, jobs=None, binary=False, palette=False,
+                 force=False, dither=False, bundle=None, max_dim=None):
         self.source_dir = Path(source_dir)
         self.output_dir = Path(output_dir)
+        self.jobs = jobs or os.cpu_count() or 1
+        self.binary = binary
+        self.palette = palette
+        self.force = force
+        self.dither = dither
+        self.bundle = bundle
+        self.max_dim = max_dim
         
         if not self.source_dir.exists():
             raise FileNotFoundError(f"Source directory not found: {source_dir}")
@@ -34,144 +198,515 @@ class ImageConverter:
         self.output_dir.mkdir(parents=True, exist_ok=True)
     
     def rgb888_to_rgb565(self, r, g, b):
-        """Convert RGB888 to RGB565 format"""
+        """Convert a single RGB888 pixel to RGB565 format (scalar reference)"""
+        return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+    
+    def pack_rgb565(self, rgb_array):
+        """Pack an (..., 3) uint8 RGB array into RGB565 in one vectorized pass"""
+        r = rgb_array[..., 0].astype(np.uint16)
+        g = rgb_array[..., 1].astype(np.uint16)
+        b = rgb_array[..., 2].astype(np.uint16)
         return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
     
-    def image_to_c_array(self, image_path):
-        """Convert a single image to C array format"""
+    def dither_rgb(self, rgb_array):
+        """Apply a 4x4 Bayer ordered dither ahead of RGB565 truncation
+        
+        The thresholds span one quantization step of each channel: 0-7 for the
+        5-bit red and blue channels and 0-3 for the 6-bit green channel.
+        """
+        height, width = rgb_array.shape[:2]
+        reps = (-(-height // 4), -(-width // 4))
+        bayer = np.tile(self._BAYER_4X4, reps)[:height, :width]
+        offsets = np.stack([bayer >> 1, bayer >> 2, bayer >> 1], axis=-1)
+        return np.clip(rgb_array + offsets, 0, 255).astype(np.uint8)
+    
+    def _pillow_rgb565(self, img):
+        """Pack an RGB image to RGB565 inside Pillow, or None if unsupported
+        
+        Pillow's "BGR;16" mode stores red in the top five bits, i.e. the same
+        layout as pack_rgb565, as 16-bit words in host byte order (little-endian
+        on x86/ARM hosts, matching the ESP32). The mode was removed in Pillow 12.
+        """
         try:
-            # Open and convert image to RGB
-            with Image.open(image_path) as img:
-                # Convert to RGB if not already
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                width, height = img.size
-                
-                # Convert to numpy array
-                img_array = np.array(img)
-                
-                # Generate variable name from filename
-                var_name = Path(image_path).stem.replace('-', '_').replace(' ', '_')
-                # Ensure valid C identifier
-                if not var_name[0].isalpha() and var_name[0] != '_':
-                    var_name = f"img_{var_name}"
-                
-                # Start building the C file content
-                c_content = []
-                c_content.append("/*")
-                c_content.append(f" * Generated from: {Path(image_path).name}")
-                c_content.append(f" * Image size: {width}x{height} pixels")
-                c_content.append(f" * Format: RGB565")
-                c_content.append(" */")
-                c_content.append("")
-                c_content.append("#pragma once")
-                c_content.append("#include <stdint.h>")
-                c_content.append("")
-                c_content.append(f"#define {var_name.upper()}_WIDTH  {width}")
-                c_content.append(f"#define {var_name.upper()}_HEIGHT {height}")
-                c_content.append("")
-                c_content.append(f"const uint16_t {var_name}_data[{width * height}] = {{")
-                
-                # Convert pixels to RGB565 and format as C array
-                pixels = []
-                for y in range(height):
-                    row_pixels = []
-                    for x in range(width):
-                        r, g, b = img_array[y, x]
-                        rgb565 = self.rgb888_to_rgb565(r, g, b)
-                        row_pixels.append(f"0x{rgb565:04X}")
-                    
-                    # Add row with proper formatting
-                    if y < height - 1:
-                        pixels.append("    " + ", ".join(row_pixels) + ",")
-                    else:
-                        pixels.append("    " + ", ".join(row_pixels))
-                
-                c_content.extend(pixels)
-                c_content.append("};")
-                c_content.append("")
-                
-                # Add structure for easy access
-                c_content.append(f"typedef struct {{")
-                c_content.append(f"    const uint16_t* data;")
-                c_content.append(f"    uint16_t width;")
-                c_content.append(f"    uint16_t height;")
-                c_content.append(f"}} {var_name}_t;")
-                c_content.append("")
-                c_content.append(f"const {var_name}_t {var_name} = {{")
-                c_content.append(f"    .data = {var_name}_data,")
-                c_content.append(f"    .width = {var_name.upper()}_WIDTH,")
-                c_content.append(f"    .height = {var_name.upper()}_HEIGHT")
-                c_content.append("};")
-                
-                return "\n".join(c_content)
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', DeprecationWarning)
+                packed = img.convert('BGR;16')
+        except ValueError:
+            return None
+        
+        width, height = img.size
+        return np.frombuffer(packed.tobytes(), dtype=np.uint16).reshape(height, width)
+    
+    def _c_var_name(self, image_path):
+        """Generate a C variable name from the image filename"""
+        var_name = re.sub(r'[^0-9A-Za-z_]', '_', Path(image_path).stem)
+        # Ensure valid C identifier
+        if not var_name.isidentifier():
+            var_name = f"img_{var_name}"
+        return var_name
+    
+    def _prepare_image(self, img):
+        """Convert an opened image to an RGB-like mode, downscaling it to max_dim if set
+        
+        RGBA and L images are kept as-is; load_rgb565 handles them in numpy
+        without a Pillow conversion pass.
+        """
+        too_large = self.max_dim and max(img.size) > self.max_dim
+        if too_large:
+            # JPEG can decode at 1/2, 1/4 or 1/8 scale, skipping the full IDCT
+            img.draft('RGB', (self.max_dim, self.max_dim))
+        
+        # Resampling RGBA premultiplies alpha, so resize in RGB instead
+        if img.mode not in self.DIRECT_MODES or (too_large and img.mode == 'RGBA'):
+            img = img.convert('RGB')
+        
+        if too_large:
+            factor = max(img.size) // self.max_dim
+            if factor > 1:
+                img = img.reduce(factor)
+            img.thumbnail((self.max_dim, self.max_dim))
+        return img
+    
+    def _rgb_array(self, img):
+        """Read an RGB, RGBA or L image into an (height, width, 3) uint8 array"""
+        img_array = np.asarray(img)
+        if img.mode == 'RGBA':
+            # Drop the alpha channel instead of compositing it
+            img_array = img_array[..., :3]
+        elif img.mode == 'L':
+            # Broadcast grayscale to three channels instead of stacking copies
+            img_array = np.broadcast_to(img_array[..., None], img_array.shape + (3,))
+        return img_array
+    
+    def load_rgb565(self, img):
+        """Convert an open RGB, RGBA or L image to a (height, width) RGB565 array"""
+        width, height = img.size
+        
+        # Let Pillow pack RGB565 natively, falling back to numpy
+        use_pillow = img.mode == 'RGB' and not self.dither
+        rgb565 = self._pillow_rgb565(img) if use_pillow else None
+        if rgb565 is None:
+            # Pillow's array interface goes through tobytes(), so np.asarray still
+            # copies the decoded pixels once (np.array would copy them twice)
+            img_array = self._rgb_array(img)
+            if img_array.dtype != np.uint8 or img_array.shape != (height, width, 3):
+                raise ValueError(
+                    f"unexpected pixel layout {img_array.dtype} {img_array.shape}"
+                )
+            if self.dither:
+                img_array = self.dither_rgb(img_array)
+            rgb565 = self.pack_rgb565(img_array)
+        return rgb565
+    
+    def decode_image(self, image_path, convert=None):
+        """Decode an image and pack its pixels, returning (width, height, packed)
+        
+        convert turns the prepared image into the packed data and defaults to
+        load_rgb565. The decoded image is closed before returning so only the
+        packed data stays alive while headers are written.
+        """
+        convert = convert or self.load_rgb565
+        with Image.open(image_path) as src:
+            # Convert to RGB if not already, shrinking oversized inputs
+            img = self._prepare_image(src)
+            width, height = img.size
+            packed = convert(img)
+            
+            # Release the decoded pixels before the write phase
+            img.close()
+            del img
+        return width, height, packed
+    
+    def write_c_array(self, image_path, fh, bin_path=None):
+        """Convert a single image to C array format and stream it to fh
+        
+        If bin_path is given, the pixel data is written there as raw
+        little-endian uint16 values and fh only receives a short header
+        declaring the embedded binary.
+        """
+        try:
+            var_name = self._c_var_name(image_path)
+            
+            # Phase 1: decode and pack the pixels
+            if self.palette:
+                width, height, (indices, palette) = self.decode_image(
+                    image_path, self.quantize_palette
+                )
+            else:
+                width, height, rgb565 = self.decode_image(image_path)
+            
+            # Phase 2: write the header from the packed data only
+            fields = self._template_fields(
+                image_path, var_name, width, height, self._pixel_format(bin_path)
+            )
+            
+            if self.palette:
+                self._write_palette_array(fh, fields, indices, palette)
+                return True
+            
+            if bin_path is not None:
+                # ESP32 is little-endian, so the raw file maps onto uint16_t[]
+                bin_path = Path(bin_path)
+                # Write through a memory map so no full-size bytes copy is made
+                mm = np.memmap(bin_path, dtype='<u2', mode='w+', shape=rgb565.shape)
+                mm[:] = rgb565
+                mm.flush()
+                del mm
                 
+                fields['bin_name'] = bin_path.name
+                fields['bin_symbol'] = self._bin_symbol(bin_path.name)
+                fh.write(_BINARY_TMPL.format_map(fields))
+                return True
+            
+            fh.write(_HEADER_TMPL.format_map(fields))
+            self._write_rows(fh, rgb565, 4)
+            fh.write(_FOOTER_TMPL.format_map(fields))
+            return True
+            
         except Exception as e:
             print(f"Error processing {image_path}: {e}")
-            return None
+            return False
     
-    def convert_image_file(self, image_path, relative_path):
-        """Convert a single image file and save the C header"""
+    def quantize_palette(self, img):
+        """Quantize an RGB image to 8-bit indices and an RGB565 palette"""
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        
+        # Only the palette entries, not every pixel, need RGB565 packing
+        pimg = img.convert('P', palette=Image.Palette.ADAPTIVE, colors=256)
+        indices = np.asarray(pimg, dtype=np.uint8)
+        palette_size = int(indices.max()) + 1
+        palette_rgb = np.array(pimg.getpalette()[:palette_size * 3], dtype=np.uint8)
+        pimg.close()
+        return indices, self.pack_rgb565(palette_rgb.reshape(-1, 3))
+    
+    def _write_palette_array(self, fh, fields, indices, palette):
+        """Write an image as 8-bit palette indices plus an RGB565 palette"""
+        palette_size = len(palette)
+        
+        fields['palette_size'] = palette_size
+        fields['palette'] = ",\n".join(
+            "    " + ", ".join(f"0x{v:04X}" for v in palette[i:i + 16].tolist())
+            for i in range(0, palette_size, 16)
+        )
+        
+        fh.write(_PALETTE_HEADER_TMPL.format_map(fields))
+        self._write_rows(fh, indices, 2)
+        fh.write(_PALETTE_FOOTER_TMPL.format_map(fields))
+    
+    def _encode_rows(self, values, digits):
+        """Encode a 2D integer array as ASCII C hex literals without Python loops
+        
+        Returns a uint8 array with one indented text line per row, each literal
+        followed by ", " and each line ending in ",\n".
+        """
+        rows, cols = values.shape
+        token = digits + 4  # "0x" + digits + ", "
+        
+        out = np.empty((rows, 4 + cols * token), dtype=np.uint8)
+        out[:, :4] = ord(' ')
+        tokens = out[:, 4:].reshape(rows, cols, token)
+        tokens[..., 0] = ord('0')
+        tokens[..., 1] = ord('x')
+        for i in range(digits):
+            shift = 4 * (digits - 1 - i)
+            tokens[..., 2 + i] = self._HEX_DIGITS[(values >> shift) & 0xF]
+        tokens[..., -2] = ord(',')
+        tokens[..., -1] = ord(' ')
+        out[:, -1] = ord('\n')
+        return out
+    
+    def _write_rows(self, fh, values, digits):
+        """Stream a 2D array as C hex literals, one image row per line"""
+        rows = len(values)
+        for start in range(0, rows, self.ROWS_PER_WRITE):
+            chunk = self._encode_rows(values[start:start + self.ROWS_PER_WRITE], digits)
+            text = chunk.tobytes().decode('ascii')
+            if start + self.ROWS_PER_WRITE >= rows:
+                # No trailing comma after the last element
+                text = text[:-2] + "\n"
+            fh.write(text)
+    
+    def _template_fields(self, image_path, var_name, width, height, pixel_format="RGB565"):
+        """Collect the values substituted into the C header templates"""
+        return {
+            'fname': Path(image_path).name,
+            'w': width,
+            'h': height,
+            'n': width * height,
+            'fmt': pixel_format,
+            'version': self.GENERATOR_VERSION,
+            'v': var_name,
+            'U': var_name.upper(),
+        }
+    
+    def write_bundle_entry(self, image_path, relative_path, fh, var_name):
+        """Write one image's defines, data array and image_t entry to a bundle"""
         try:
-            print(f"Converting: {relative_path}")
+            width, height, rgb565 = self.decode_image(image_path)
             
-            # Generate C array content
-            c_content = self.image_to_c_array(image_path)
-            if c_content is None:
-                return False
+            fields = self._template_fields(image_path, var_name, width, height)
+            fields['fname'] = relative_path.as_posix()
+            
+            fh.write(_BUNDLE_ENTRY_HEADER_TMPL.format_map(fields))
+            self._write_rows(fh, rgb565, 4)
+            fh.write(_BUNDLE_ENTRY_FOOTER_TMPL.format_map(fields))
+            return True
+            
+        except Exception as e:
+            print(f"Error processing {image_path}: {e}")
+            return False
+    
+    def write_bundle(self, tasks):
+        """Convert all images into the single header at self.bundle
+        
+        Returns a CONVERTED or FAILED outcome per task.
+        """
+        bundle_file = self.output_dir / self.bundle
+        
+        # Always regenerated: a single output cannot tell which images it is stale for
+        bundle_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        results = []
+        var_names = []
+        taken = set(self.BUNDLE_RESERVED_NAMES)
+        with open(bundle_file, 'w') as fh:
+            # Shared preamble, written once for all images
+            fh.write(_BUNDLE_HEADER_TMPL.format_map({
+                'source': self.source_dir.name,
+            }))
+            
+            for file_path, relative_path in tasks:
+                print(f"Converting: {relative_path}")
+                
+                # Every image shares one namespace with the bundle's own declarations
+                var_name = self._c_var_name(file_path)
+                var_upper = var_name.upper()
+                identifiers = {var_name, f"{var_name}_data",
+                               f"{var_upper}_WIDTH", f"{var_upper}_HEIGHT"}
+                if identifiers & taken:
+                    print(f"Error processing {file_path}: name '{var_name}' clashes "
+                          f"with another declaration in the bundle")
+                    results.append(self.FAILED)
+                    continue
+                
+                if self.write_bundle_entry(file_path, relative_path, fh, var_name):
+                    var_names.append(var_name)
+                    taken |= identifiers
+                    results.append(self.CONVERTED)
+                else:
+                    results.append(self.FAILED)
             
+            # Registry of every image in the bundle
+            if var_names:
+                fh.write(_BUNDLE_REGISTRY_TMPL.format_map({
+                    'count': len(var_names),
+                    'source': self.source_dir.name,
+                    'entries': ",\n".join(f"    &{var_name}" for var_name in var_names),
+                }))
+            else:
+                fh.write("#define ALL_IMAGES_COUNT 0\n")
+        
+        print(f"  -> Generated: {bundle_file}")
+        return results
+    
+    def _bin_symbol(self, bin_name):
+        """Symbol stem ESP-IDF derives from an embedded file's name
+        
+        CMake's MAKE_C_IDENTIFIER prefixes names starting with a digit with '_'.
+        """
+        bin_symbol = re.sub(r'[^0-9A-Za-z]', '_', bin_name)
+        if bin_name[0].isdigit():
+            bin_symbol = f"_{bin_symbol}"
+        return bin_symbol
+    
+    def _drop_bin_clashes(self, tasks):
+        """Split off tasks whose .bin files would embed under a duplicate symbol
+        
+        ESP-IDF names embedded symbols by file name only, so icons/home.bin and
+        logos/home.bin cannot be linked together. Returns (tasks, failures).
+        """
+        symbols = set()
+        kept = []
+        failures = []
+        for file_path, relative_path in tasks:
+            symbol = self._bin_symbol(relative_path.with_suffix('.bin').name)
+            if symbol in symbols:
+                print(f"Error processing {file_path}: duplicate binary symbol "
+                      f"'_binary_{symbol}_start'")
+                failures.append(self.FAILED)
+                continue
+            symbols.add(symbol)
+            kept.append((file_path, relative_path))
+        return kept, failures
+    
+    def _pixel_format(self, bin_path=None):
+        """Describe the output mode for the header's Format: comment"""
+        if self.palette:
+            pixel_format = "8-bit indexed, RGB565 palette"
+        elif bin_path is not None:
+            pixel_format = f"RGB565 (raw little-endian data in {Path(bin_path).name})"
+        else:
+            pixel_format = "RGB565"
+        
+        options = []
+        if self.dither and not self.palette:
+            options.append("dithered")
+        if self.max_dim:
+            options.append(f"max {self.max_dim}px")
+        if options:
+            pixel_format += "; " + ", ".join(options)
+        return pixel_format
+    
+    def _header_info(self, header_file):
+        """Read the "Key: value" lines of a generated header's leading comment"""
+        info = {}
+        with open(header_file) as f:
+            for line in f:
+                if line.startswith(" */"):
+                    break
+                key, sep, value = line[3:].rstrip("\n").partition(": ")
+                if line.startswith(" * ") and sep:
+                    info[key] = value
+        return info
+    
+    def _header_matches(self, header_file, bin_path=None):
+        """Check whether a header was generated by this version with these options"""
+        info = self._header_info(header_file)
+        return (info.get("Format") == self._pixel_format(bin_path)
+                and info.get("Generator version") == str(self.GENERATOR_VERSION))
+    
+    def _is_up_to_date(self, image_path, *output_files):
+        """Check that every output file exists and is newer than the source"""
+        source_mtime = Path(image_path).stat().st_mtime
+        for output_file in output_files:
+            if output_file is None:
+                continue
+            if not output_file.exists() or output_file.stat().st_mtime < source_mtime:
+                return False
+        return True
+    
+    def convert_image_file(self, image_path, relative_path):
+        """Convert a single image file and save the C header
+        
+        Returns CONVERTED, SKIPPED (outputs already up to date) or FAILED.
+        """
+        try:
             # Create output path with .h extension
             output_file = self.output_dir / relative_path.with_suffix('.h')
             
+            # Raw pixel data goes next to the header in binary mode
+            bin_file = output_file.with_suffix('.bin') if self.binary else None
+            
+            # Skip images whose outputs are newer than the source, like make,
+            # unless they were generated with different options or by an older version
+            if (not self.force
+                    and self._is_up_to_date(image_path, output_file, bin_file)
+                    and self._header_matches(output_file, bin_file)):
+                print(f"Up to date: {relative_path}")
+                return self.SKIPPED
+            
+            print(f"Converting: {relative_path}")
+            
             # Create output directory if needed
             output_file.parent.mkdir(parents=True, exist_ok=True)
             
-            # Write C header file
+            # Stream C header file straight to disk
             with open(output_file, 'w') as f:
-                f.write(c_content)
+                success = self.write_c_array(image_path, f, bin_file)
+            
+            if not success:
+                # Don't leave a truncated header behind
+                output_file.unlink(missing_ok=True)
+                if bin_file is not None:
+                    bin_file.unlink(missing_ok=True)
+                return self.FAILED
+            
+            if bin_file is None:
+                # Drop raw data left over from an earlier --binary run
+                output_file.with_suffix('.bin').unlink(missing_ok=True)
             
             print(f"  -> Generated: {output_file}")
-            return True
+            return self.CONVERTED
             
         except Exception as e:
             print(f"Error converting {image_path}: {e}")
-            return False
+            return self.FAILED
+    
+    def find_images(self):
+        """Recursively find all supported image files in the source directory"""
+        found = []
+        # Single traversal; os.walk already separates files from directories
+        for root, dirs, files in os.walk(self.source_dir):
+            root_path = Path(root)
+            for file in files:
+                file_path = root_path / file
+                if file_path.suffix.lower() in self.SUPPORTED_FORMATS:
+                    found.append(file_path)
+        return sorted(found)
     
     def scan_and_convert(self):
         """Recursively scan source directory and convert all images"""
-        converted_count = 0
-        error_count = 0
-        
         print(f"Scanning source directory: {self.source_dir}")
         print(f"Output directory: {self.output_dir}")
         print()
         
-        # Walk through all files in source directory
-        for root, dirs, files in os.walk(self.source_dir):
-            root_path = Path(root)
-            
-            for file in files:
-                file_path = root_path / file
-                
-                # Check if file is a supported image format
-                if file_path.suffix.lower() in self.SUPPORTED_FORMATS:
-                    # Calculate relative path from source directory
-                    relative_path = file_path.relative_to(self.source_dir)
-                    
-                    if self.convert_image_file(file_path, relative_path):
-                        converted_count += 1
-                    else:
-                        error_count += 1
+        # Collect all supported image files in source directory
+        tasks = [(file_path, file_path.relative_to(self.source_dir))
+                 for file_path in self.find_images()]
+        
+        # Every .bin shares one symbol namespace once embedded
+        failures = []
+        if self.binary:
+            tasks, failures = self._drop_bin_clashes(tasks)
+        
+        file_paths = [file_path for file_path, _ in tasks]
+        relative_paths = [relative_path for _, relative_path in tasks]
+        
+        # Convert files in parallel; each image is independent and CPU-bound
+        if self.bundle:
+            results = self.write_bundle(tasks)
+        elif self.jobs > 1 and len(tasks) >= self.MIN_PARALLEL_TASKS:
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                results = list(executor.map(
+                    _convert_one, repeat(self), file_paths, relative_paths,
+                    chunksize=8
+                ))
+        else:
+            results = [self.convert_image_file(file_path, relative_path)
+                       for file_path, relative_path in tasks]
+        
+        results += failures
+        
+        converted_count = results.count(self.CONVERTED)
+        skipped_count = results.count(self.SKIPPED)
+        error_count = results.count(self.FAILED)
         
         print()
         print(f"Conversion complete!")
         print(f"  Images converted: {converted_count}")
+        print(f"  Up to date (skipped): {skipped_count}")
         print(f"  Errors: {error_count}")
         
         return converted_count, error_count
 
 
+def _convert_one(converter, image_path, relative_path):
+    """Worker entry point for converting one image in a separate process"""
+    return converter.convert_image_file(image_path, relative_path)
+
+
+def _positive_int(value):
+    """argparse type for integers of at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
 def main():
     """Main function"""
     parser = argparse.ArgumentParser(
@@ -194,17 +729,82 @@ Examples:
         help='Output directory for generated C header files'
     )
     
+    parser.add_argument(
+        '--jobs', '-j',
+        type=_positive_int,
+        default=None,
+        help='Number of worker processes (default: number of CPUs)'
+    )
+    
+    mode_group = parser.add_mutually_exclusive_group()
+    
+    mode_group.add_argument(
+        '--binary',
+        action='store_true',
+        help='Write pixel data to a raw .bin file next to a short .h header'
+    )
+    
+    mode_group.add_argument(
+        '--palette',
+        action='store_true',
+        help='Quantize to 8-bit palette indices with an RGB565 palette'
+    )
+    
+    mode_group.add_argument(
+        '--bundle',
+        metavar='FILE',
+        default=None,
+        help='Write all images into one header FILE inside the output directory'
+    )
+    
+    parser.add_argument(
+        '--max-dim',
+        type=_positive_int,
+        default=None,
+        metavar='N',
+        help='Downscale images so neither side exceeds N pixels'
+    )
+    
+    parser.add_argument(
+        '--dither',
+        action='store_true',
+        help='Apply ordered dithering to reduce banding in RGB565 output '
+             '(not with --palette)'
+    )
+    
+    parser.add_argument(
+        '--force', '-f',
+        action='store_true',
+        help='Regenerate outputs even if they are newer than the source images'
+    )
+    
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
-        help='Enable verbose output'
+        help='Enable verbose output, including NumPy SIMD runtime information'
     )
     
     args = parser.parse_args()
     
+    if args.palette and args.dither:
+        # Palette quantization picks its own colors; the Bayer dither only
+        # applies to RGB565 output
+        parser.error("--dither cannot be combined with --palette")
+    
+    if args.verbose:
+        # The RGB565 packing uses NumPy's SIMD (e.g. AVX2/AVX-512) bitwise loops
+        print(f"NumPy {np.__version__} runtime:")
+        np.show_runtime()
+        print()
+    
     try:
         # Create converter instance
-        converter = ImageConverter(args.source_dir, args.output_dir)
+        converter = ImageConverter(
+            args.source_dir, args.output_dir,
+            jobs=args.jobs, binary=args.binary, palette=args.palette,
+            force=args.force, dither=args.dither, bundle=args.bundle,
+            max_dim=args.max_dim
+        )
         
         # Perform conversion
         converted, errors = converter.scan_and_convert()
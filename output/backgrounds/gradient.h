@@ -2,6 +2,7 @@
  * Generated from: gradient.png
  * Image size: 128x64 pixels
  * Format: RGB565
+ * Generator version: 2
  */
 
 #pragma once
@@ -11,70 +12,70 @@
 #define GRADIENT_HEIGHT 64
 
 const uint16_t gradient_data[8192] = {
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0,
-    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x003E, 0x003E, 0x003E, 0x003E, 0x005D, 0x005D, 0x005D, 0x005D, 0x007C, 0x007C, 0x007C, 0x007C, 0x009B, 0x009B, 0x009B, 0x009B, 0x00BA, 0x00BA, 0x00BA, 0x00BA, 0x00D9, 0x00D9, 0x00D9, 0x00D9, 0x00F8, 0x00F8, 0x00F8, 0x00F8, 0x0017, 0x0017, 0x0017, 0x0017, 0x0036, 0x0036, 0x0036, 0x0036, 0x0055, 0x0055, 0x0055, 0x0055, 0x0074, 0x0074, 0x0074, 0x0074, 0x0093, 0x0093, 0x0093, 0x0093, 0x00B2, 0x00B2, 0x00B2, 0x00B2, 0x00D1, 0x00D1, 0x00D1, 0x00D1, 0x00F0, 0x00F0, 0x00F0, 0x00F0, 0x000F, 0x000F, 0x000F, 0x000F, 0x002E, 0x002E, 0x002E, 0x002E, 0x004D, 0x004D, 0x004D, 0x004D, 0x006C, 0x006C, 0x006C, 0x006C, 0x008B, 0x008B, 0x008B, 0x008B, 0x00AA, 0x00AA, 0x00AA, 0x00AA, 0x00C9, 0x00C9, 0x00C9, 0x00C9, 0x00E8, 0x00E8, 0x00E8, 0x00E8, 0x0007, 0x0007, 0x0007, 0x0007, 0x0026, 0x0026, 0x0026, 0x0026, 0x0045, 0x0045, 0x0045, 0x0045, 0x0064, 0x0064, 0x0064, 0x0064, 0x0083, 0x0083, 0x0083, 0x0083, 0x00A2, 0x00A2, 0x00A2, 0x00A2, 0x00C1, 0x00C1, 0x00C1, 0x00C1, 0x00E0, 0x00E0, 0x00E0
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0,
+    0x001F, 0x001F, 0x001F, 0x001F, 0x001F, 0x083E, 0x083E, 0x083E, 0x083E, 0x105D, 0x105D, 0x105D, 0x105D, 0x187C, 0x187C, 0x187C, 0x187C, 0x209B, 0x209B, 0x209B, 0x209B, 0x28BA, 0x28BA, 0x28BA, 0x28BA, 0x30D9, 0x30D9, 0x30D9, 0x30D9, 0x38F8, 0x38F8, 0x38F8, 0x38F8, 0x4117, 0x4117, 0x4117, 0x4117, 0x4936, 0x4936, 0x4936, 0x4936, 0x5155, 0x5155, 0x5155, 0x5155, 0x5974, 0x5974, 0x5974, 0x5974, 0x6193, 0x6193, 0x6193, 0x6193, 0x69B2, 0x69B2, 0x69B2, 0x69B2, 0x71D1, 0x71D1, 0x71D1, 0x71D1, 0x79F0, 0x79F0, 0x79F0, 0x79F0, 0x820F, 0x820F, 0x820F, 0x820F, 0x8A2E, 0x8A2E, 0x8A2E, 0x8A2E, 0x924D, 0x924D, 0x924D, 0x924D, 0x9A6C, 0x9A6C, 0x9A6C, 0x9A6C, 0xA28B, 0xA28B, 0xA28B, 0xA28B, 0xAAAA, 0xAAAA, 0xAAAA, 0xAAAA, 0xB2C9, 0xB2C9, 0xB2C9, 0xB2C9, 0xBAE8, 0xBAE8, 0xBAE8, 0xBAE8, 0xC307, 0xC307, 0xC307, 0xC307, 0xCB26, 0xCB26, 0xCB26, 0xCB26, 0xD345, 0xD345, 0xD345, 0xD345, 0xDB64, 0xDB64, 0xDB64, 0xDB64, 0xE383, 0xE383, 0xE383, 0xE383, 0xEBA2, 0xEBA2, 0xEBA2, 0xEBA2, 0xF3C1, 0xF3C1, 0xF3C1, 0xF3C1, 0xFBE0, 0xFBE0, 0xFBE0
 };
 
 typedef struct {
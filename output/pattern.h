@@ -2,6 +2,7 @@
  * Generated from: pattern.png
  * Image size: 16x16 pixels
  * Format: RGB565
+ * Generator version: 2
  */
 
 #pragma once
@@ -11,22 +12,22 @@
 #define PATTERN_HEIGHT 16
 
 const uint16_t pattern_data[256] = {
-    0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF,
-    0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF,
-    0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000,
-    0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF,
-    0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF,
-    0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000,
-    0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF,
-    0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF,
-    0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000,
-    0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF,
-    0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF,
-    0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000,
-    0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000, 0x00FF, 0x00FF, 0x0000, 0x0000
+    0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF,
+    0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF,
+    0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000,
+    0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000,
+    0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF,
+    0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF,
+    0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000,
+    0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000,
+    0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF,
+    0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF,
+    0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000,
+    0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000,
+    0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF,
+    0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF,
+    0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000,
+    0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF, 0x0000, 0x0000
 };
 
 typedef struct {